@@ -1,15 +1,19 @@
 from .logic import (
     cohen_d_to_r_pb,
     auc_to_d,
+    auc_to_d_batch,
     logodds_to_d,
     logodds_from_sens_spec,
     logodds_from_ppv_npv,
+    sens_spec_to_r_pb,
 )
 
 __all__ = [
     "cohen_d_to_r_pb",
     "auc_to_d",
+    "auc_to_d_batch",
     "logodds_to_d",
     "logodds_from_sens_spec",
     "logodds_from_ppv_npv",
+    "sens_spec_to_r_pb",
 ]
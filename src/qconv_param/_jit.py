@@ -0,0 +1,43 @@
+import functools
+import math
+from numba import get_num_threads, njit, prange, vectorize
+
+from .logic import _LOGODDS_TO_D_FACTOR
+
+
+def _logodds_to_d(logodds):
+    """
+    Element-wise kernel of logodds_to_d.
+    """
+    return logodds * _LOGODDS_TO_D_FACTOR
+
+
+@functools.lru_cache(maxsize=None)
+def _logodds_to_d_ufunc():
+    """
+    Builds the multi-threaded ufunc version of logodds_to_d on first use,
+    rather than compiling it when the module is imported.
+    """
+    return vectorize(
+        ["float64(float64)", "float32(float32)"], target="parallel", cache=True
+    )(_logodds_to_d)
+
+
+@njit(parallel=True, cache=True, error_model="numpy")
+def _sens_spec_to_r_pb(sensitivity, specificity, p, eps, out):
+    """
+    Fused, multi-threaded version of
+    cohen_d_to_r_pb(logodds_to_d(logodds_from_sens_spec(sens, spec)), p)
+    for 1-D arrays, writing the result to out. Sensitivities and
+    specificities are clipped to [eps, 1 - eps] like in
+    logodds_from_sens_spec.
+    """
+    h = 1.0 / (p * (1.0 - p))
+    for i in prange(sensitivity.shape[0]):
+        sens = min(max(sensitivity[i], eps), 1.0 - eps)
+        spec = min(max(specificity[i], eps), 1.0 - eps)
+        logodds = (math.log(sens) - math.log1p(-sens)) + (
+            math.log(spec) - math.log1p(-spec)
+        )
+        d = logodds * _LOGODDS_TO_D_FACTOR
+        out[i] = d / math.sqrt(d * d + h)
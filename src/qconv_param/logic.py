@@ -1,31 +1,169 @@
+import functools
 import math
 import numpy as np
-from scipy.stats import norm
+from scipy.special import logit, ndtri
 
+# Scaling factor between log-odds and Cohen's d (Hasselblad & Hedges, 1995).
+_LOGODDS_TO_D_FACTOR = math.sqrt(3.0) / math.pi
 
-def cohen_d_to_r_pb(d, p=0.5):
+# Scaling factor of the simplified AUC to Cohen's d conversion.
+_SQRT2 = math.sqrt(2.0)
+
+# Proportions are clipped to [eps, 1 - eps] before taking logits, so that
+# values of exactly 0 or 1 yield a large but finite Log-Odds Ratio.
+_EPS = 1e-9
+_ONE_MINUS_EPS = 1.0 - _EPS
+
+# Below this many elements, starting the threads of the multi-threaded Numba
+# kernels costs more than it saves over plain NumPy.
+_PARALLEL_MIN_SIZE = 1_000_000
+_PARALLEL_DTYPES = (np.dtype(np.float32), np.dtype(np.float64))
+
+
+# Python scalar types that the conversion functions handle with plain `math`
+# arithmetic instead of dispatching to NumPy.
+_NUMBER_TYPES = (int, float)
+
+
+def _scalar_result(result, out):
+    """
+    Returns a 0-d NumPy result as a Python float, so that array support does
+    not change the result type of scalar calls. A caller-supplied `out`
+    array is returned unchanged, even if it is 0-d.
+
+    The inputs broadcast to the shape of the result, so a 0-d result means
+    that every argument was a scalar.
+    """
+    if out is None and np.ndim(result) == 0:
+        return np.asarray(result).item()
+    return result
+
+
+@functools.lru_cache(maxsize=None)
+def _load_jit():
+    """
+    Imports the optional Numba kernels on first use, so that importing the
+    package does not pay for importing Numba. Returns None if Numba is not
+    installed.
+    """
+    try:
+        from . import _jit
+    except ImportError:
+        return None
+    return _jit
+
+
+def _parallel_jit(*arrays):
+    """
+    Returns the Numba kernels if all arrays are large float32 or float64
+    arrays and Numba can use more than one thread, otherwise None.
+    """
+    for x in arrays:
+        if not (
+            isinstance(x, np.ndarray)
+            and x.dtype in _PARALLEL_DTYPES
+            and x.size >= _PARALLEL_MIN_SIZE
+        ):
+            return None
+    jit = _load_jit()
+    if jit is None or jit.get_num_threads() < 2:
+        return None
+    return jit
+
+
+def _float_dtype(x):
+    """
+    Returns the floating-point dtype to compute in for input x, so that
+    float32 arrays are not upcast to float64 by array-valued parameters.
+    """
+    dtype = np.asarray(x).dtype
+    return dtype if dtype.kind == "f" else np.dtype(np.float64)
+
+
+def _clip_eps(dtype):
+    """
+    Returns the clipping margin for proportions of the given dtype, widened
+    for low-precision floats in which 1 - 1e-9 would round to 1.
+    """
+    return max(_EPS, float(np.finfo(dtype).eps))
+
+
+def _scalar_logodds(a, b):
+    """
+    Computes logit(a) + logit(b) for Python scalars, with both clipped to
+    [eps, 1 - eps].
+    """
+    if a < _EPS:
+        a = _EPS
+    elif a > _ONE_MINUS_EPS:
+        a = _ONE_MINUS_EPS
+    if b < _EPS:
+        b = _EPS
+    elif b > _ONE_MINUS_EPS:
+        b = _ONE_MINUS_EPS
+    return math.log((a * b) / ((1.0 - a) * (1.0 - b)))
+
+
+def _clipped_logit(x):
+    """
+    Computes logit(x) with x clipped to [eps, 1 - eps].
+    """
+    x = np.asarray(x)
+    eps = _clip_eps(_float_dtype(x))
+    return logit(np.minimum(np.maximum(x, eps), 1 - eps))
+
+
+def _close(a, b):
+    """
+    Same as np.isclose with its default tolerances, but evaluated in plain
+    Python for int and float arguments to avoid the ufunc overhead.
+    """
+    if isinstance(a, _NUMBER_TYPES) and isinstance(b, _NUMBER_TYPES):
+        return abs(a - b) <= 1e-8 + 1e-5 * abs(b)
+    return np.isclose(a, b)
+
+
+def cohen_d_to_r_pb(d, p=0.5, out=None):
     """
     Converts Cohen's d to a point-biserial correlation coefficient.
 
     Args:
-        d (float): The standardized mean difference (Cohen's d).
-        p (float): The proportion of the total sample in the focal group.
-                   Defaults to 0.5 (equal group sizes).
+        d (float or array_like): The standardized mean difference (Cohen's d).
+        p (float or array_like): The proportion of the total sample in the
+                   focal group. Defaults to 0.5 (equal group sizes).
+        out (ndarray, optional): Array to store the result in. It must have
+                   the broadcast shape of the inputs and is owned by the
+                   caller; no new output array is allocated.
 
     Returns:
-        float: The estimated point-biserial correlation (r_pb).
+        float or ndarray: The estimated point-biserial correlation (r_pb).
 
     Reference:
         McGrath, R. E., & Meyer, G. J. (2006). When effect sizes disagree:
         The case of r and d. Psychological Methods, 11(4), 386.
     """
-    h = 1 / (p * (1 - p))
+    # Scalar calls with the default p = 0.5 are the most common, so they are
+    # detected first with the cheapest tests (h = 1 / (0.5 * 0.5) = 4).
+    if type(p) is float and p == 0.5 and type(d) is float and out is None:
+        return d / math.sqrt(d * d + 4.0)
+
+    if out is None and isinstance(d, _NUMBER_TYPES) and isinstance(p, _NUMBER_TYPES):
+        return d / math.sqrt(d * d + 1.0 / (p * (1.0 - p)))
+
+    d = np.asarray(d)
+
+    # For the default balanced case 1 / (p * (1 - p)) is exactly 4.
+    if isinstance(p, float) and p == 0.5:
+        h = 4.0
+    else:
+        p = np.asarray(p, dtype=_float_dtype(d))
+        h = 1.0 / (p * (1.0 - p))
 
-    r_pb = d / math.sqrt(d**2 + h)
-    return r_pb
+    r_pb = np.divide(d, np.sqrt(d * d + h), out=out)
+    return _scalar_result(r_pb, out)
 
 
-def auc_to_d(auc, s1=None, s2=None, p1=None):
+def auc_to_d(auc, s1=None, s2=None, p1=None, out=None):
     """
     Converts AUC to Cohen's d.
 
@@ -35,100 +173,314 @@ def auc_to_d(auc, s1=None, s2=None, p1=None):
     - Either condition reduces to d = sqrt(2) * z
 
     Args:
-        auc (float): The Area Under the Curve (0.5 to 1.0).
+        auc (float or array_like): The Area Under the Curve (0.5 to 1.0).
         s1 (float, optional): Standard deviation of the first class.
         s2 (float, optional): Standard deviation of the second class.
         p1 (float, optional): Proportion (base rate) of the first class (0 to 1).
+        out (ndarray, optional): Array to store the result in. It must have
+                   the broadcast shape of the inputs and is owned by the
+                   caller; no new output array is allocated.
 
     Returns:
-        float: The derived Cohen's d value.
+        float or ndarray: The derived Cohen's d value.
 
     Reference:
         Ruscio, J. (2008). A probability-based measure of effect size:
         Robustness to base rates and other factors. Psychological Methods, 13(1), 19.
     """
 
-    # Validate that the AUC lies within its meaningful range.
-    if not (0.5 <= auc <= 1.0):
+    # Validate that the AUC lies within its meaningful range, i.e. within
+    # 0.25 of 0.75. A single comparison also rejects NaN.
+    is_number = isinstance(auc, _NUMBER_TYPES)
+    if is_number:
+        diff = auc - 0.75
+        in_range = diff * diff <= 0.0625
+    else:
+        auc = np.asarray(auc)
+        diff = auc - 0.75
+        in_range = np.all(diff * diff <= 0.0625)
+    if not in_range:
         raise ValueError("AUC must be between 0.5 and 1.0")
 
-    # Convert AUC to a standard normal z-score.
-    z_score = norm.ppf(auc)
+    # Scalar calls are memoized, since the same AUC and context are often
+    # converted repeatedly (e.g. across simulation iterations). Unhashable
+    # context values (e.g. 0-d arrays) bypass the cache.
+    if out is None and (is_number or auc.ndim == 0):
+        try:
+            return _auc_to_d_cached(float(auc), s1, s2, p1)
+        except TypeError:
+            pass
 
-    # If no contextual parameters are provided, assume a fully balanced case
-    # with equal variances and equal base rates.
-    if s1 is None and s2 is None and p1 is None:
-        return np.sqrt(2) * z_score
+    return _scalar_result(_auc_to_d(auc, s1, s2, p1, out=out), out)
 
-    # If the class standard deviations are equal, the base rates cancel out
-    # and the simplified conversion applies.
-    if s1 is not None and s2 is not None and np.isclose(s1, s2):
-        return np.sqrt(2) * z_score
 
-    # If the class base rates are balanced, variance differences cancel out
-    # and the simplified conversion applies.
-    if p1 is not None and np.isclose(p1, 0.5):
-        return np.sqrt(2) * z_score
+@functools.lru_cache(maxsize=2048)
+def _auc_to_d_cached(auc, s1, s2, p1):
+    """
+    Memoized scalar version of _auc_to_d.
+    """
+    return _auc_to_d(auc, s1, s2, p1)
+
+
+def _auc_to_d(auc, s1, s2, p1, out=None):
+    """
+    Converts an already validated AUC to Cohen's d (see auc_to_d).
+    """
+
+    have_s = s1 is not None and s2 is not None
+    have_p = p1 is not None
+
+    # The base rate is a proportion of the sample.
+    if have_p and not 0.0 < p1 < 1.0:
+        raise ValueError("p1 must be between 0 and 1")
+
+    # The simplified conversion applies if no contextual parameters are
+    # provided (fully balanced case), if the class standard deviations are
+    # equal (base rates cancel out), or if the class base rates are balanced
+    # (variance differences cancel out).
+    balanced = (
+        (s1 is None and s2 is None and p1 is None)
+        or (have_s and _close(s1, s2))
+        or (have_p and _close(p1, 0.5))
+    )
 
     # If no simplification applies, all contextual parameters are required
     # to avoid making implicit assumptions.
-    if s1 is None or s2 is None or p1 is None:
+    if not balanced and not (have_s and have_p):
         raise ValueError(
             "Full parametric conversion requires s1, s2, and p1 "
             "unless an exact simplification condition is met."
         )
 
-    # Compute Cohen's d using the full parametric formula.
-    p2 = 1 - p1
-    numerator = s1**2 + s2**2
-    denominator = (p1 * s1**2) + (p2 * s2**2)
+    if balanced:
+        scale = _SQRT2
+    else:
+        scale = _parametric_scale(float(s1), float(s2), float(p1))
+
+    # Convert AUC to a standard normal z-score only once the scale is known.
+    # The z-scores of the boundary values 0.5 and 1.0 are known exactly.
+    if out is None and np.ndim(auc) == 0:
+        if auc == 0.5:
+            z_score = 0.0
+        elif auc == 1.0:
+            z_score = math.inf
+        else:
+            z_score = float(ndtri(auc))
+        return scale * z_score
+
+    # 0-d inputs without out returned above, so z_score is an array that
+    # can hold the result without another temporary.
+    z_score = ndtri(auc, out=out)
+    return np.multiply(scale, z_score, out=z_score)
+
+
+@functools.lru_cache(maxsize=128)
+def _parametric_scale(s1, s2, p1):
+    """
+    Computes the scale factor of the full parametric AUC to Cohen's d formula.
+
+    The class context is usually fixed across many AUC values, so the result
+    is memoized.
+    """
+    s1_sq = s1 * s1
+    s2_sq = s2 * s2
+    numerator = s1_sq + s2_sq
+    denominator = (p1 * s1_sq) + ((1 - p1) * s2_sq)
+    return math.sqrt(numerator / denominator)
+
+
+def auc_to_d_batch(auc, s1, s2, p1, out=None):
+    """
+    Converts AUC to Cohen's d for a batch of rows, each with its own class
+    standard deviations and base rate.
 
-    return np.sqrt(numerator / denominator) * z_score
+    Rows where s1 = s2 or p1 = 0.5 use the simplified conversion
+    d = sqrt(2) * z; all other rows use the full parametric formula
+    (see auc_to_d).
 
+    Args:
+        auc (array_like): The Area Under the Curve values (0.5 to 1.0).
+        s1 (array_like): Standard deviations of the first class.
+        s2 (array_like): Standard deviations of the second class.
+        p1 (array_like): Proportions (base rates) of the first class (0 to 1).
+        out (ndarray, optional): Array to store the result in. It must have
+                   the broadcast shape of the inputs and is owned by the
+                   caller; no new output array is allocated.
 
-def logodds_to_d(logodds):
+    Returns:
+        float or ndarray: The derived Cohen's d values.
+    """
+    # Every row needs its full context; np.asarray would turn None into NaN.
+    if s1 is None or s2 is None or p1 is None:
+        raise ValueError("Batch conversion requires s1, s2, and p1 for every row.")
+
+    auc = np.asarray(auc)
+    dtype = _float_dtype(auc)
+    auc, s1, s2, p1 = np.broadcast_arrays(
+        auc,
+        np.asarray(s1, dtype=dtype),
+        np.asarray(s2, dtype=dtype),
+        np.asarray(p1, dtype=dtype),
+    )
+
+    # Validate that the AUC values lie within their meaningful range.
+    diff = auc - 0.75
+    if not np.all(diff * diff <= 0.0625):
+        raise ValueError("AUC must be between 0.5 and 1.0")
+
+    # The base rates are proportions of the sample.
+    if not np.all((p1 > 0) & (p1 < 1)):
+        raise ValueError("p1 must be between 0 and 1")
+
+    # Compute the parametric scale factor for every row, then use the
+    # simplified factor wherever a simplification condition is met. Rows
+    # with s1 = s2 = 0 divide by zero here, but their value is discarded.
+    s1_sq = s1 * s1
+    s2_sq = s2 * s2
+    with np.errstate(invalid="ignore", divide="ignore"):
+        scale = np.sqrt((s1_sq + s2_sq) / (p1 * s1_sq + (1 - p1) * s2_sq))
+    simplified = np.isclose(s1, s2) | np.isclose(p1, 0.5)
+
+    scale = np.where(simplified, _SQRT2, scale)
+
+    # The inputs are broadcast to the result shape, so the z-scores array can
+    # hold the result without another temporary.
+    z_score = ndtri(auc, out=out)
+    if out is None and np.ndim(z_score) == 0:
+        return _scalar_result(scale * z_score, out)
+    return np.multiply(scale, z_score, out=z_score)
+
+
+def logodds_to_d(logodds, out=None):
     """
     Converts LOg-Odds Ratio to Cohen's d.
 
     Args:
-        logodds (float): The Log-Odds Ratio.
+        logodds (float or array_like): The Log-Odds Ratio.
+        out (ndarray, optional): Array to store the result in. It must have
+                   the broadcast shape of the inputs and is owned by the
+                   caller; no new output array is allocated.
 
     Returns:
-        float: The derived Cohen's d value.
+        float or ndarray: The derived Cohen's d value.
 
     Reference:
         Hasselblad, V., & Hedges, L. V. (1995). Meta-analysis of screening
         and diagnostic tests. Psychological Bulletin, 117(1), 167.
     """
-    factor = math.sqrt(3) / math.pi
-    return logodds * factor
+    if out is None and isinstance(logodds, _NUMBER_TYPES):
+        return logodds * _LOGODDS_TO_D_FACTOR
+
+    # Large float arrays are multiplied in parallel when Numba is available.
+    jit = _parallel_jit(logodds)
+    if jit is not None and (out is None or out.dtype == logodds.dtype):
+        return jit._logodds_to_d_ufunc()(logodds, out=out)
+    return _scalar_result(np.multiply(logodds, _LOGODDS_TO_D_FACTOR, out=out), out)
 
 
-def logodds_from_sens_spec(sensitivity, specificity):
+def logodds_from_sens_spec(sensitivity, specificity, out=None):
     """
     Calculates the Log-Odds Ratio from Sensitivity and Specificity.
 
     Formula: ln((Sens * Spec) / ((1 - Sens) * (1 - Spec)))
+           = logit(Sens) + logit(Spec)
+
+    Values are clipped to [eps, 1 - eps] to avoid division by zero or
+    log(0), so inputs of exactly 0 or 1 give a large but finite result.
+    eps is 1e-9 for Python floats, float64 and integer inputs, and the
+    machine epsilon of lower-precision floats (about 1.2e-7 for float32),
+    in which 1 - 1e-9 rounds to 1. The result at the boundaries therefore
+    depends on the input dtype. If `out` is given, the result is written
+    to this caller-owned array.
     """
-    # Using clip to avoid division by zero or log(0)
-    eps = 1e-9
-    sens = np.clip(sensitivity, eps, 1 - eps)
-    spec = np.clip(specificity, eps, 1 - eps)
+    if (
+        out is None
+        and isinstance(sensitivity, _NUMBER_TYPES)
+        and isinstance(specificity, _NUMBER_TYPES)
+    ):
+        return _scalar_logodds(sensitivity, specificity)
 
-    odds_ratio = (sens * spec) / ((1 - sens) * (1 - spec))
-    return math.log(odds_ratio)
+    logodds = np.add(_clipped_logit(sensitivity), _clipped_logit(specificity), out=out)
+    return _scalar_result(logodds, out)
 
 
-def logodds_from_ppv_npv(ppv, npv):
+def logodds_from_ppv_npv(ppv, npv, out=None):
     """
     Calculates the Log-Odds Ratio from Positive Predictive Value (PPV)
     and Negative Predictive Value (NPV).
 
     Formula: ln((PPV * NPV) / ((1 - PPV) * (1 - NPV)))
+           = logit(PPV) + logit(NPV)
+
+    Values are clipped to [eps, 1 - eps] to avoid division by zero or
+    log(0), so inputs of exactly 0 or 1 give a large but finite result.
+    eps is 1e-9 for Python floats, float64 and integer inputs, and the
+    machine epsilon of lower-precision floats (about 1.2e-7 for float32),
+    in which 1 - 1e-9 rounds to 1. The result at the boundaries therefore
+    depends on the input dtype. If `out` is given, the result is written
+    to this caller-owned array.
     """
-    eps = 1e-9
-    p = np.clip(ppv, eps, 1 - eps)
-    n = np.clip(npv, eps, 1 - eps)
+    if (
+        out is None
+        and isinstance(ppv, _NUMBER_TYPES)
+        and isinstance(npv, _NUMBER_TYPES)
+    ):
+        return _scalar_logodds(ppv, npv)
+
+    return _scalar_result(
+        np.add(_clipped_logit(ppv), _clipped_logit(npv), out=out), out
+    )
+
 
-    odds_ratio = (p * n) / ((1 - p) * (1 - n))
-    return math.log(odds_ratio)
+def sens_spec_to_r_pb(sensitivity, specificity, p=0.5, out=None):
+    """
+    Converts Sensitivity and Specificity directly to a point-biserial
+    correlation coefficient.
+
+    Equivalent to chaining logodds_from_sens_spec, logodds_to_d and
+    cohen_d_to_r_pb. When Numba is available and can use several threads,
+    large 1-D float arrays are converted in a single fused, multi-threaded
+    pass without intermediate arrays.
+
+    Args:
+        sensitivity (float or array_like): The sensitivity values.
+        specificity (float or array_like): The specificity values.
+        p (float): The proportion of the total sample in the focal group.
+                   Defaults to 0.5 (equal group sizes).
+        out (ndarray, optional): Array to store the result in. It must have
+                   the broadcast shape of the inputs and is owned by the
+                   caller; no new output array is allocated.
+
+    Returns:
+        float or ndarray: The estimated point-biserial correlation (r_pb).
+    """
+    if (
+        out is None
+        and isinstance(sensitivity, _NUMBER_TYPES)
+        and isinstance(specificity, _NUMBER_TYPES)
+    ):
+        d = logodds_to_d(logodds_from_sens_spec(sensitivity, specificity))
+        return cohen_d_to_r_pb(d, p=p)
+
+    sensitivity = np.asarray(sensitivity)
+    specificity = np.asarray(specificity)
+
+    jit = None
+    if (
+        sensitivity.ndim == 1
+        and sensitivity.shape == specificity.shape
+        and np.ndim(p) == 0
+        and (out is None or out.shape == sensitivity.shape)
+    ):
+        jit = _parallel_jit(sensitivity, specificity)
+
+    if jit is not None:
+        dtype = np.result_type(sensitivity, specificity)
+        if out is None:
+            out = np.empty(sensitivity.shape, dtype=dtype)
+        eps = _clip_eps(dtype)
+        jit._sens_spec_to_r_pb(sensitivity, specificity, float(p), eps, out)
+        return out
+
+    logodds = logodds_from_sens_spec(sensitivity, specificity)
+    return cohen_d_to_r_pb(logodds_to_d(logodds), p=p, out=out)
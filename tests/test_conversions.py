@@ -1,3 +1,4 @@
+import warnings
 import pytest
 import numpy as np
 import qconv_param as qcp
@@ -109,3 +110,198 @@ def test_cohen_d_to_r_pb_unbalanced():
 
     # 6. Check recovery
     assert pytest.approx(r_recovered, abs=0.01) == r_observed
+
+
+def test_array_inputs_match_scalar_calls():
+    """
+    Validation: Do array inputs give the same results as element-wise scalar calls?
+    """
+    sens = np.array([0.55, 0.7, 0.8, 0.95])
+    spec = np.array([0.6, 0.65, 0.75, 0.9])
+
+    lor = qcp.logodds_from_sens_spec(sens, spec)
+    d = qcp.logodds_to_d(lor)
+    r = qcp.cohen_d_to_r_pb(d, p=0.3)
+
+    expected = [
+        qcp.cohen_d_to_r_pb(qcp.logodds_to_d(qcp.logodds_from_sens_spec(s, c)), p=0.3)
+        for s, c in zip(sens, spec)
+    ]
+
+    assert isinstance(expected[0], float)
+    assert r.shape == sens.shape
+    np.testing.assert_allclose(r, expected)
+
+
+def test_auc_to_d_batch_matches_auc_to_d():
+    """
+    Validation: Does auc_to_d_batch agree with row-by-row auc_to_d calls,
+    including rows where a simplification condition is met?
+    """
+    auc = np.array([0.6, 0.7, 0.8, 0.9])
+    s1 = np.array([1.6, 1.0, 2.0, 1.2])
+    s2 = np.array([1.0, 1.0, 1.5, 0.8])
+    p1 = np.array([0.2, 0.3, 0.5, 0.7])
+
+    d_batch = qcp.auc_to_d_batch(auc, s1, s2, p1)
+    d_rows = [qcp.auc_to_d(*row) for row in zip(auc, s1, s2, p1)]
+
+    np.testing.assert_allclose(d_batch, d_rows)
+
+    # Both functions reject base rates outside (0, 1) and missing context.
+    for bad_p1 in [0.0, 1.0, 1.5]:
+        with pytest.raises(ValueError, match="p1"):
+            qcp.auc_to_d_batch(auc, s1, s2, np.full_like(p1, bad_p1))
+        with pytest.raises(ValueError, match="p1"):
+            qcp.auc_to_d(auc[0], s1[0], s2[0], bad_p1)
+    with pytest.raises(ValueError):
+        qcp.auc_to_d_batch(auc, s1, s2, None)
+
+    # Rows with zero spread use the simplified formula without warnings.
+    with warnings.catch_warnings():
+        warnings.simplefilter("error")
+        d_zero = qcp.auc_to_d_batch([0.7], [0.0], [0.0], [0.3])
+    np.testing.assert_allclose(d_zero, [qcp.auc_to_d(0.7)])
+
+    assert isinstance(qcp.auc_to_d_batch(0.7, 1.6, 1.0, 0.2), float)
+
+
+def test_import_does_not_load_scipy_stats():
+    """
+    Validation: Does importing the package avoid the scipy.stats and numba
+    import costs?
+    """
+    import subprocess
+    import sys
+
+    code = (
+        "import sys, qconv_param; "
+        "print('scipy.stats' in sys.modules, 'numba' in sys.modules)"
+    )
+    output = subprocess.check_output([sys.executable, "-c", code], text=True)
+
+    assert output.strip() == "False False"
+
+
+def test_out_parameter_writes_into_buffer(monkeypatch):
+    """
+    Validation: Is the result written into, and returned as, a caller-provided
+    output array?
+    """
+    values = np.array([0.6, 0.7, 0.8])
+    ones = np.ones_like(values)
+    calls = [
+        (qcp.cohen_d_to_r_pb, (values,), {"p": 0.3}),
+        (qcp.auc_to_d, (values,), {"s1": 1.6, "s2": 1.0, "p1": 0.2}),
+        (qcp.auc_to_d_batch, (values, 1.6 * ones, ones, 0.2 * ones), {}),
+        (qcp.logodds_to_d, (values,), {}),
+        (qcp.logodds_from_sens_spec, (values, values[::-1]), {}),
+        (qcp.logodds_from_ppv_npv, (values, values[::-1]), {}),
+        (qcp.sens_spec_to_r_pb, (values, values[::-1]), {"p": 0.3}),
+    ]
+
+    for func, args, kwargs in calls:
+        out = np.empty_like(values)
+        result = func(*args, out=out, **kwargs)
+
+        assert result is out, func.__name__
+        np.testing.assert_allclose(out, func(*args, **kwargs))
+
+    # A 0-d output array is returned as is, not converted to a float.
+    out = np.empty(())
+    assert qcp.cohen_d_to_r_pb(0.5, out=out) is out
+    assert qcp.auc_to_d(0.7, out=out) is out
+    assert qcp.auc_to_d_batch(0.7, 1.6, 1.0, 0.2, out=out) is out
+    assert pytest.approx(out[()]) == qcp.auc_to_d(0.7, s1=1.6, s2=1.0, p1=0.2)
+
+    # Force the Numba kernels, which are otherwise reserved for large arrays
+    # on multi-threaded hosts.
+    _jit = qcp.logic._load_jit()
+    if _jit is not None:
+        monkeypatch.setattr(qcp.logic, "_parallel_jit", lambda *arrays: _jit)
+        for func, args, kwargs in calls[3:4] + calls[-1:]:
+            out = np.empty_like(values)
+            result = func(*args, out=out, **kwargs)
+
+            assert result is out, func.__name__
+            np.testing.assert_allclose(out, func(*args, **kwargs))
+
+
+def test_float32_inputs_stay_float32():
+    """
+    Validation: Do float32 arrays keep their precision through the pipeline?
+    """
+    sens = np.array([0.6, 0.7, 0.8], dtype=np.float32)
+    spec = np.array([0.65, 0.75, 0.85], dtype=np.float32)
+    auc = np.array([0.6, 0.7, 0.8], dtype=np.float32)
+
+    d = qcp.logodds_to_d(qcp.logodds_from_sens_spec(sens, spec))
+    r = qcp.cohen_d_to_r_pb(d, p=0.3)
+
+    assert d.dtype == np.float32
+    assert r.dtype == np.float32
+    assert qcp.auc_to_d(auc, s1=1.6, s2=1.0, p1=0.2).dtype == np.float32
+    assert qcp.auc_to_d_batch(auc, [1.6] * 3, [1.0] * 3, [0.2] * 3).dtype == np.float32
+
+
+def test_sens_spec_to_r_pb_matches_chained_conversions():
+    """
+    Validation: Does the fused conversion agree with chaining the individual
+    conversion functions?
+    """
+    np.random.seed(42)
+    sens = np.random.uniform(0.05, 0.95, size=1_000)
+    spec = np.random.uniform(0.05, 0.95, size=1_000)
+
+    # Include perfect and zero sensitivities/specificities.
+    sens[:3] = [1.0, 0.0, 1.0]
+    spec[:3] = [0.9, 1.0, 1.0]
+
+    lor = qcp.logodds_from_sens_spec(sens, spec)
+    r_chained = qcp.cohen_d_to_r_pb(qcp.logodds_to_d(lor), p=0.3)
+
+    r_fused = qcp.sens_spec_to_r_pb(sens, spec, p=0.3)
+    assert np.all(np.isfinite(r_fused))
+    np.testing.assert_allclose(r_fused, r_chained, rtol=1e-12)
+
+    # The fused Numba kernel only runs for large arrays on multi-threaded
+    # hosts, so exercise it directly as well.
+    _jit = qcp.logic._load_jit()
+    if _jit is not None:
+        r_kernel = np.empty_like(sens)
+        _jit._sens_spec_to_r_pb(sens, spec, 0.3, 1e-9, r_kernel)
+        np.testing.assert_allclose(r_kernel, r_chained, rtol=1e-9)
+
+
+def test_auc_to_d_boundaries_and_validation():
+    """
+    Validation: Are the AUC boundary values mapped exactly and values outside
+    the meaningful range rejected?
+    """
+    assert qcp.auc_to_d(0.5) == 0.0
+    assert qcp.auc_to_d(1.0, s1=1.6, s2=1.0, p1=0.2) == np.inf
+
+    for auc in [0.49999999999999994, 1.0000000000000002, np.nan]:
+        with pytest.raises(ValueError):
+            qcp.auc_to_d(auc)
+
+    for p1 in [0.0, 1.0, 1.5]:
+        with pytest.raises(ValueError, match="p1"):
+            qcp.auc_to_d(0.7, s1=1.0, s2=2.0, p1=p1)
+
+
+def test_perfect_sensitivity_gives_finite_correlation():
+    """
+    Validation: Does a reported sensitivity of 1.0 still give a finite
+    correlation through the documented pipeline?
+    """
+    r = qcp.cohen_d_to_r_pb(qcp.logodds_to_d(qcp.logodds_from_sens_spec(1.0, 0.9)))
+    assert pytest.approx(r, abs=1e-4) == 0.9877
+
+    lor = qcp.logodds_from_ppv_npv(0.0, 1.0)
+    assert pytest.approx(lor, abs=1e-6) == 0.0
+
+    sens = np.array([1.0, 0.0], dtype=np.float32)
+    lor32 = qcp.logodds_from_sens_spec(sens, np.float32(0.9))
+    assert lor32.dtype == np.float32
+    assert np.all(np.isfinite(lor32))